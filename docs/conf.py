@@ -19,22 +19,20 @@ try:
 except ImportError:
     sphinx_rtd_theme = None
 
-# -- Execute the _about package ----------------------------------------------
+# -- Read the metadata from about.py -----------------------------------------
 
 base_dir = Path(__file__).parent.parent
 about = {}
+exec((base_dir / "src" / "erbsland_maze" / "about.py").read_text(encoding="utf-8"), about)
 sys.path.insert(0, str(base_dir / "src"))
 
 
 # -- Project information -----------------------------------------------------
 
 project = "Erbsland Maze"
-if True:
-    import erbsland_maze.about
-
-    copyright = erbsland_maze.about.COPYRIGHT
-    author = erbsland_maze.about.AUTHOR
-    version = release = erbsland_maze.about.VERSION
+copyright = about["COPYRIGHT"]
+author = about["AUTHOR"]
+version = release = about["VERSION"]
 
 # -- General configuration ---------------------------------------------------
 
@@ -43,6 +41,9 @@ if True:
 # ones.
 extensions = ["sphinx.ext.autodoc"]
 
+# The documented classes do not need cairo, mock it so the docs build without the native library.
+autodoc_mock_imports = ["cairo"]
+
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ["_templates"]
 
@@ -16,6 +16,8 @@ class ClosingModifier(Modifier):
     A modifier to close paths in the maze.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         closing: Closing,
@@ -37,17 +39,18 @@ class ClosingModifier(Modifier):
     def from_text(cls, text: str) -> Self:
         size = RoomSize(1, 1)
         offset = RoomOffset()
-        elements = text.split("/")
-        if len(elements) < 2:
+        elements = iter(text.split("/"))
+        closing_text, placement_text = next(elements), next(elements, None)
+        if placement_text is None:
             raise ValueError("You must specify at least the closing type and placement parameter.")
-        closing = Closing.from_text(elements.pop(0))
-        placement = Placement.from_text(elements.pop(0))
+        closing = Closing.from_text(closing_text)
+        placement = Placement.from_text(placement_text)
         if placement == Placement.RANDOM:
             raise ValueError("Closings must not be randomly placed.")
-        if elements:
-            size = RoomSize.from_text(elements.pop(0))
-            if elements:
-                offset = RoomOffset.from_text(elements.pop(0))
-                if elements:
+        if (size_text := next(elements, None)) is not None:
+            size = RoomSize.from_text(size_text)
+            if (offset_text := next(elements, None)) is not None:
+                offset = RoomOffset.from_text(offset_text)
+                if next(elements, None) is not None:
                     raise ValueError("There are too many parameters.")
         return cls(closing, placement, size, offset, name=text)
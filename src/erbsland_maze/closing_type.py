@@ -3,6 +3,25 @@
 import enum
 from typing import Self
 
+ALIAS_MAP: dict[str, str] = {
+    "c": "corner_paths",
+    "cnw": "corner_top_left",
+    "cne": "corner_top_right",
+    "cse": "corner_bottom_right",
+    "csw": "corner_bottom_left",
+    "dw": "direction_west",
+    "dn": "direction_north",
+    "de": "direction_east",
+    "ds": "direction_south",
+    "dh": "direction_horizontal",
+    "dv": "direction_vertical",
+    "m": "middle_paths",
+    "mw": "middle_west",
+    "mn": "middle_north",
+    "me": "middle_east",
+    "ms": "middle_south",
+}
+
 
 class ClosingType(enum.Enum):
 
@@ -25,38 +44,18 @@ class ClosingType(enum.Enum):
 
     @classmethod
     def alias_map(cls) -> dict[str, str]:
-        return {
-            "c": "corner_paths",
-            "cnw": "corner_top_left",
-            "cne": "corner_top_right",
-            "cse": "corner_bottom_right",
-            "csw": "corner_bottom_left",
-            "dw": "direction_west",
-            "dn": "direction_north",
-            "de": "direction_east",
-            "ds": "direction_south",
-            "dh": "direction_horizontal",
-            "dv": "direction_vertical",
-            "m": "middle_paths",
-            "mw": "middle_west",
-            "mn": "middle_north",
-            "me": "middle_east",
-            "ms": "middle_south",
-        }
+        return dict(ALIAS_MAP)  # A copy, so callers cannot change the shared lookup tables.
 
     @classmethod
     def from_name(cls, name: str) -> Self:
-        alias_map = cls.alias_map()
-        if name in alias_map:
-            name = alias_map[name]
-        return cls(name)
+        closing_type = _NAME_MAP.get(name)
+        if closing_type is None:
+            raise ValueError(f"'{name}' is not a valid {cls.__name__}")
+        return closing_type
 
     @classmethod
     def all_names(cls) -> list[str]:
-        result = list(cls.alias_map().keys())
-        result.extend([x.value for x in cls])
-        result.sort()
-        return result
+        return list(_ALL_NAMES)
 
     @classmethod
     def from_text(cls, text: str) -> Self:
@@ -65,6 +64,14 @@ class ClosingType(enum.Enum):
             raise ValueError("The closing type parameter is empty.")
         try:
             return cls.from_name(text)
-        except KeyError or ValueError:
+        except (KeyError, ValueError):
             valid = ", ".join(cls.all_names())
             raise ValueError(f"The text '{text}' is not a valid closing type. Valid values are {valid}.")
+
+
+# Maps all aliases and values to the closing types.
+_NAME_MAP: dict[str, ClosingType] = {x.value: x for x in ClosingType}
+_NAME_MAP.update({alias: ClosingType(value) for alias, value in ALIAS_MAP.items()})
+
+# All valid names, sorted for error messages.
+_ALL_NAMES: tuple[str, ...] = tuple(sorted(_NAME_MAP.keys()))
@@ -25,12 +25,13 @@ class Corner(enum.StrEnum):
         """
         Get the opposite corner.
         """
-        match self:
-            case Corner.TOP_RIGHT:
-                return Corner.BOTTOM_LEFT
-            case Corner.BOTTOM_RIGHT:
-                return Corner.TOP_LEFT
-            case Corner.BOTTOM_LEFT:
-                return Corner.TOP_RIGHT
-            case Corner.TOP_LEFT:
-                return Corner.BOTTOM_RIGHT
+        return _OPPOSITE_CORNERS[self]
+
+
+# The opposite corners.
+_OPPOSITE_CORNERS = {
+    Corner.TOP_LEFT: Corner.BOTTOM_RIGHT,
+    Corner.TOP_RIGHT: Corner.BOTTOM_LEFT,
+    Corner.BOTTOM_RIGHT: Corner.TOP_LEFT,
+    Corner.BOTTOM_LEFT: Corner.TOP_RIGHT,
+}
@@ -15,12 +15,8 @@ class Direction(enum.IntEnum):
     WEST = 3
 
     def opposite(self):
-        match self:
-            case Direction.NORTH:
-                return Direction.SOUTH
-            case Direction.EAST:
-                return Direction.WEST
-            case Direction.SOUTH:
-                return Direction.NORTH
-            case Direction.WEST:
-                return Direction.EAST
+        return _OPPOSITE_DIRECTIONS[self]
+
+
+# The opposite directions, indexed by the direction value.
+_OPPOSITE_DIRECTIONS = (Direction.SOUTH, Direction.WEST, Direction.NORTH, Direction.EAST)
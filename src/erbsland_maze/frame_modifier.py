@@ -13,6 +13,8 @@ class FrameModifier(Modifier):
     A modifier to create a frame of blank rooms around the maze.
     """
 
+    __slots__ = ()
+
     def __init__(self, insets: RoomInsets = RoomInsets(1, 1, 1, 1), name: str = None):
         super().__init__(modifier_type=ModifierType.FRAME, insets=insets, name=name)
 
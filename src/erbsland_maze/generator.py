@@ -1,5 +1,6 @@
 #  Copyright © 2003-2024 Tobias Erbsland. Web: https://erbsland.dev/
 #  SPDX-License-Identifier: GPL-3.0-or-later
+import random
 import sys
 from itertools import product, combinations
 from pathlib import Path
@@ -16,12 +17,19 @@ from .path_join_info import PathJoinInfo
 from .path_pair import PathPair
 from .placement import Placement
 from .room import Room
+from .room_connection import RoomConnection
 from .room_grid import RoomGrid
 from .room_location import RoomLocation
 from .room_size import RoomSize
 from .room_type import RoomType
 
 
+def _ignore_output(*args, **kwargs) -> None:
+    """
+    Replacement for `print` that ignores all output, used for non-verbose runs.
+    """
+
+
 class Generator:
     """
     The maze generator.
@@ -45,6 +53,7 @@ class Generator:
         self.room_grid = RoomGrid(size)  # Create the room grid with the calculated size.
         self.path_end_rooms: list[Room] = []  # The rooms associated with the path ends.
         self.error_marks: list[ErrorMark] = []  # Error marks for the output.
+        self._log = print if self.setup.verbose else _ignore_output  # Bound once, to skip the checks later.
 
     def print_info(self):
         """
@@ -76,18 +85,27 @@ class Generator:
         for path_end in sorted(self.setup.path_ends, key=lambda path_end: path_end.placement.order_value):
             location = self.room_grid.get_location_for_path_end(path_end)
             room = self.room_grid[location]
-            if path_end.placement == Placement.RANDOM and room.type != RoomType.PATH:
-                # For random placements, do a few attempts to find a better spot.
-                for _ in range(100):
-                    if room.type == RoomType.PATH and not room.is_surrounded_by_blanks:
-                        break
-                    location = self.room_grid.get_location_for_path_end(path_end)
+            if path_end.placement == Placement.RANDOM and (room.type != RoomType.PATH or room.is_surrounded_by_blanks):
+                # For random placements, pick one of the remaining suitable spots instead.
+                # Test each room only once, as merged rooms cover several locations.
+                suitable_rooms = {
+                    candidate
+                    for candidate in self.room_grid.get_all_rooms()
+                    if candidate.type == RoomType.PATH and not candidate.is_surrounded_by_blanks
+                }
+                suitable_locations = [
+                    location
+                    for location in self.room_grid.get_all_locations()
+                    if self.room_grid[location] in suitable_rooms
+                ]
+                if suitable_locations:
+                    location = random.choice(suitable_locations)
                     room = self.room_grid[location]
             if room.is_surrounded_by_blanks:
                 self.raise_generator_error(
                     f"The configured path end '{path_end}' seems to end up in a spot at location ({location}) with "
-                    "no connections to other paths. Check your configuration. If the placement is random, 100 "
-                    "attempts to find a better spot were unsuccessful.",
+                    "no connections to other paths. Check your configuration. If the placement is random, there "
+                    "was no better spot left.",
                     room.location,
                     room.size,
                 )
@@ -95,7 +113,7 @@ class Generator:
                 self.raise_generator_error(
                     f"The configured path end '{path_end}' collides with another path end and would end up in the "
                     f"same room at location ({location}). Check your configuration. If the placement is random, "
-                    "100 attempts to find a better spot were unsuccessful.",
+                    "there was no better spot left.",
                     room.location,
                     room.size,
                 )
@@ -122,14 +140,14 @@ class Generator:
         """
         Prepare the rooms and connections between them.
         """
-        if self.setup.verbose:
-            print("Preparing rooms...")
+        self._log("Preparing rooms...")
         self.room_grid.fill_with_rooms()
-        self.room_grid.apply_blank_modifiers(self.setup.modifiers.get_frame_modifiers())
-        self.room_grid.apply_blank_modifiers(self.setup.modifiers.get_blank_modifiers())
+        modifiers = self.setup.modifiers
+        # Frames and blanks both only mark rooms as blank, so they are applied in one pass.
+        self.room_grid.apply_blank_modifiers(modifiers.get_frame_modifiers() + modifiers.get_blank_modifiers())
         self.room_grid.connect_all_rooms()
-        self.room_grid.apply_merge_modifiers(self.setup.modifiers.get_merge_modifiers())
-        self.room_grid.apply_closing_modifiers(self.setup.modifiers.get_closing_modifiers())
+        self.room_grid.apply_merge_modifiers(modifiers.get_merge_modifiers())
+        self.room_grid.apply_closing_modifiers(modifiers.get_closing_modifiers())
         self._prepare_path_ends()
         self.room_grid.remove_blank_rooms()
         self._verify_preparations()
@@ -138,15 +156,18 @@ class Generator:
         """
         Generate the paths for the main maze that connects the start and end point.
         """
-        if self.setup.verbose:
-            print("Generating the paths for the maze...")
+        self._log("Generating the paths for the maze...")
         generator_stacks = [
             GeneratorStack.initialize_room(room, index + 1, self.setup)
             for index, room in enumerate(self.path_end_rooms)
         ]
-        while any(generator_stack.has_moves_left() for generator_stack in generator_stacks):
+        # A stack without moves never gets new moves, so it can be dropped from the rotation.
+        while generator_stacks:
             for generator_stack in generator_stacks:
                 generator_stack.one_step()
+            generator_stacks = [
+                generator_stack for generator_stack in generator_stacks if generator_stack.has_moves_left()
+            ]
 
     def get_unused_room(self) -> Optional[Room]:
         """
@@ -160,11 +181,13 @@ class Generator:
         """
         If there are isolated areas that have no paths, fill them with decoy paths.
         """
-        if self.setup.verbose:
-            print("Filling islands...")
+        self._log("Filling islands...")
         path_id = 101
-        while unused_room := self.get_unused_room():
-            generator_stack = GeneratorStack.initialize_room(unused_room, path_id, self.setup)
+        # Rooms never become unused again while filling, so a single pass finds every island.
+        for room in self.room_grid.get_all_rooms():
+            if room.is_used:
+                continue
+            generator_stack = GeneratorStack.initialize_room(room, path_id, self.setup)
             while generator_stack.has_moves_left():
                 generator_stack.one_step()
 
@@ -172,8 +195,7 @@ class Generator:
         """
         Do basic verifications of the generated maze, to make sure there are no issues in the algorithm.
         """
-        if self.setup.verbose:
-            print("Verifying generated paths...")
+        self._log("Verifying generated paths...")
         for room in self.room_grid.get_all_rooms():
             if not room.is_used:
                 self.raise_generator_error(
@@ -199,27 +221,33 @@ class Generator:
         Yet, if for some reason a path cannot be connected to any other primary paths, the process stops with an
         error.
         """
-        if self.setup.verbose:
-            print("Connect all paths...")
-        best_joins: dict[PathPair, PathJoinInfo] = {}
+        self._log("Connect all paths...")
+        # Only keep the longest candidate per path pair, and create the join infos for these winners.
+        best_candidates: dict[tuple[int, int], tuple[int, RoomConnection]] = {}
         for connection in self.room_grid.get_join_candidates():
-            join_info = connection.get_path_join_info()
-            old_join_info = best_joins.get(join_info.paths)
-            if old_join_info is None or join_info.total_length > old_join_info.total_length:
-                best_joins[join_info.paths] = join_info
+            path_a, path_b = connection.a.room.path_id, connection.b.room.path_id
+            key = (path_a, path_b) if path_a < path_b else (path_b, path_a)
+            total_length = connection.total_path_length
+            old_candidate = best_candidates.get(key)
+            if old_candidate is None or total_length > old_candidate[0]:
+                best_candidates[key] = (total_length, connection)
+        best_joins: dict[PathPair, PathJoinInfo] = {}
+        for key, (total_length, connection) in best_candidates.items():
+            paths = PathPair(*key)
+            best_joins[paths] = PathJoinInfo(paths, total_length, connection)
 
         # Stage 1
-        paths_to_connect = list(
-            [index + 1 for index, path_end in enumerate(self.setup.path_ends) if not path_end.is_dead_end]
-        )
+        paths_to_connect = [
+            index + 1 for index, path_end in enumerate(self.setup.path_ends) if not path_end.is_dead_end
+        ]
         path_groups = PathGroups()
         for path_a, path_b in combinations(paths_to_connect, r=2):
             if path_groups.are_connected(path_a, path_b):
                 continue  # Skip already connected paths.
             group_a, group_b = path_groups.members_of(path_a), path_groups.members_of(path_b)
-            joins = [PathPair(path_a, path_b) for path_a, path_b in product(group_a, group_b)]
+            join_infos = (best_joins.get(PathPair(a, b)) for a, b in product(group_a, group_b))
             longest_join_info = max(
-                (best_joins.get(paths) for paths in joins if best_joins.get(paths) is not None),
+                (join_info for join_info in join_infos if join_info is not None),
                 key=lambda join_info: join_info.total_length,
                 default=None,
             )
@@ -251,9 +279,8 @@ class Generator:
 
         :param path: The output path file.
         """
-        if self.setup.verbose:
-            print("Rendering image...")
-        self.layout.render_image(path, list(self.room_grid.get_all_rooms()), self.path_end_rooms)
+        self._log("Rendering image...")
+        self.layout.render_image(path, self.room_grid.get_all_rooms(), self.path_end_rooms)
 
     def generate_and_save(self, path: Path):
         """
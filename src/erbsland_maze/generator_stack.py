@@ -29,25 +29,25 @@ class GeneratorStack:
         """
         Test if this stack has moves left.
         """
-        return len(self.rooms) > 1 or self.rooms[0].unused_connections()
+        return len(self.rooms) > 1 or self.rooms[0].has_unused_connections()
 
     def one_step(self) -> None:
         """
         Progress one step of the maze algorithm for this stack.
         """
-        room = self.last_room()
-        room.close_blocked_connections()
-        unused_connections = room.unused_connections()
+        rooms = self.rooms
+        room = rooms[-1]
+        unused_connections = room.close_blocked_connections()
         if unused_connections:
             # TODO: Add weights.
             connection = random.choice(unused_connections)
             connection.is_used = True
             target_room = connection.remote_room(room)
             target_room.path_id = self.path_id
-            self.rooms.append(target_room)
-            target_room.path_length = len(self.rooms)
-        elif len(self.rooms) > 1:
-            self.rooms.pop()
+            rooms.append(target_room)
+            target_room.path_length = len(rooms)
+        elif len(rooms) > 1:
+            rooms.pop()
 
     @classmethod
     def initialize_room(cls, room: Room, path_id: int, setup: GeneratorSetup) -> "GeneratorStack":
@@ -1,6 +1,5 @@
 #  Copyright © 2003-2024 Tobias Erbsland. Web: https://erbsland.dev/
 #  SPDX-License-Identifier: GPL-3.0-or-later
-import math
 
 from .point import Point
 from .types import GenericLine
@@ -11,6 +10,8 @@ class Line(GenericLine):
     A straight line between two points.
     """
 
+    __slots__ = ("p1", "p2")
+
     def __init__(self, p1: Point, p2: Point):
         """
         Create a new line.
@@ -21,8 +22,13 @@ class Line(GenericLine):
         self.p1 = p1
         self.p2 = p2
 
-    def __eq__(self, other: "Line"):
-        return self
+    def __eq__(self, other: "Line") -> bool:
+        if not isinstance(other, Line):
+            return False
+        return self.p1 == other.p1 and self.p2 == other.p2
+
+    def __hash__(self) -> int:
+        return hash((self.p1, self.p2))
 
     @property
     def first(self) -> Point:
@@ -49,8 +55,7 @@ class Line(GenericLine):
         x3, y3 = other.p1.x, other.p1.y
         x4, y4 = other.p2.x, other.p2.y
 
-        slope_difference_a = (x1 - x2) * (y3 - y1) - (x3 - x1) * (y1 - y2)
-        slope_difference_b = (x1 - x2) * (y4 - y1) - (x4 - x1) * (y1 - y2)
-        return math.isclose(slope_difference_a, 0.0, rel_tol=1e-6) and math.isclose(
-            slope_difference_b, 0.0, rel_tol=1e-6
-        )
+        # A relative tolerance against zero only accepts zero itself, so compare directly.
+        if (x1 - x2) * (y3 - y1) - (x3 - x1) * (y1 - y2) != 0.0:
+            return False
+        return (x1 - x2) * (y4 - y1) - (x4 - x1) * (y1 - y2) == 0.0
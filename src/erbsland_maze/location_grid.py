@@ -12,7 +12,7 @@ from .room_location import RoomLocation
 from .room_size import RoomSize
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class LocationGrid:
     """
     A rectangular grid of room locations.
@@ -66,7 +66,10 @@ class LocationGrid:
         :return: `True` if the location is a corner.
         """
         if corner is None:
-            return any([location == self.get_corner(c) for c in Corner])
+            # Test the coordinates, instead of creating all four corner locations.
+            left, top = self.location.x, self.location.y
+            right, bottom = left + self.size.width - 1, top + self.size.height - 1
+            return location.x in (left, right) and location.y in (top, bottom)
         return location == self.get_corner(corner)
 
     @property
@@ -111,7 +114,13 @@ class LocationGrid:
         :return: `True` if the given location is at the middle.
         """
         if direction is None:
-            return any(location == self.get_middle(d) for d in Direction)
+            # Test the coordinates, instead of creating all four middle locations.
+            left, top = self.location.x, self.location.y
+            right, bottom = left + self.size.width - 1, top + self.size.height - 1
+            middle_x, middle_y = left + (self.size.width - 1) // 2, top + (self.size.height - 1) // 2
+            return (location.x == middle_x and location.y in (top, bottom)) or (
+                location.y == middle_y and location.x in (left, right)
+            )
         return location == self.get_middle(direction)
 
     def contains(self, location: RoomLocation) -> bool:
@@ -130,10 +139,9 @@ class LocationGrid:
         """
         Get all locations in this room grid.
         """
-        return [
-            RoomLocation(self.location.x + x, self.location.y + y)
-            for x, y in product(range(self.size.width), range(self.size.height))
-        ]
+        x_values = range(self.location.x, self.location.x + self.size.width)
+        y_values = range(self.location.y, self.location.y + self.size.height)
+        return [RoomLocation(x, y) for x, y in product(x_values, y_values)]
 
     def is_frame(self, location: RoomLocation, insets: RoomInsets = RoomInsets(1, 1, 1, 1)) -> bool:
         """
@@ -143,15 +151,13 @@ class LocationGrid:
         :param insets: The size of the frame.
         :return: `True` if the room is part of the frame.
         """
-        if not self.contains(location):
+        # Work with the relative coordinates, to avoid creating a new location.
+        x = location.x - self.location.x
+        y = location.y - self.location.y
+        width, height = self.size.width, self.size.height
+        if not (0 <= x < width and 0 <= y < height):
             return False
-        location -= self.location
-        return (
-            location.x < insets.east
-            or location.y < insets.north
-            or location.x >= (self.size.width - insets.west)
-            or location.y >= (self.size.height - insets.south)
-        )
+        return x < insets.east or y < insets.north or x >= (width - insets.west) or y >= (height - insets.south)
 
     def all_frame_locations(self, insets: RoomInsets = RoomInsets(1, 1, 1, 1)) -> list[RoomLocation]:
         """
@@ -160,7 +166,16 @@ class LocationGrid:
         :param insets: The insets of the frame.
         :return: All locations that are part of the frame.
         """
-        return [location for location in self.all_locations() if self.is_frame(location, insets)]
+        # Build the frame column by column, in the same order as `all_locations`, without testing each location.
+        width, height = self.size.width, self.size.height
+        all_y = range(height)
+        top_end = min(insets.north, height)
+        edge_y = [*range(top_end), *range(max(height - insets.south, top_end), height)]
+        result: list[RoomLocation] = []
+        for x in range(width):
+            y_values = all_y if x < insets.east or x >= width - insets.west else edge_y
+            result.extend(RoomLocation(self.location.x + x, self.location.y + y) for y in y_values)
+        return result
 
     def location_for_placement_and_size(self, placement: Placement, size: RoomSize) -> RoomLocation:
         """
@@ -15,6 +15,8 @@ class MergeModifier(Modifier):
     A modifier to merge rooms in the maze.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, placement: Placement, size: RoomSize = RoomSize(1, 1), offset: RoomOffset = RoomOffset(), name: str = None
     ):
@@ -24,15 +26,13 @@ class MergeModifier(Modifier):
     def from_text(cls, text: str) -> Self:
         size = RoomSize(1, 1)
         offset = RoomOffset()
-        elements = text.split("/")
-        if not elements:
-            raise ValueError("You must specify at least the placement parameter.")
-        placement = Placement.from_text(elements.pop(0))
-        if elements:
-            size = RoomSize.from_text(elements.pop(0))
-            if elements:
-                offset = RoomOffset.from_text(elements.pop(0))
-                if elements:
+        elements = iter(text.split("/"))
+        placement = Placement.from_text(next(elements))
+        if (size_text := next(elements, None)) is not None:
+            size = RoomSize.from_text(size_text)
+            if (offset_text := next(elements, None)) is not None:
+                offset = RoomOffset.from_text(offset_text)
+                if next(elements, None) is not None:
                     raise ValueError("There are too many parameters.")
         if placement == Placement.RANDOM and not offset.is_zero:
             raise ValueError("You must not set an offset for a random placement.")
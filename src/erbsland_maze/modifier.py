@@ -18,6 +18,8 @@ class Modifier(ABC):
     Do not use this class directly. Use the derived classes instead.
     """
 
+    __slots__ = ("_modifier_type", "_placement", "_size", "_insets", "_offset", "_closing", "_text", "_name")
+
     def __init__(
         self,
         modifier_type: ModifierType,
@@ -48,12 +50,19 @@ class Modifier(ABC):
         self._insets: RoomInsets = insets
         self._offset: RoomOffset = offset
         self._closing: Closing = closing
+        self._text: str = self._build_text()  # Modifiers do not change, so the text is built only once.
         if name:
             self._name = name
         else:
-            self._name = self.__str__()
+            self._name = self._text
 
     def __str__(self) -> str:
+        return self._text
+
+    def _build_text(self) -> str:
+        """
+        Build the text representation of this modifier.
+        """
         result = [f"{self._modifier_type.value}"]
         if self._closing:
             result.append(f"{self._closing}")
@@ -17,12 +17,19 @@ class Modifiers:
 
     def __init__(self, modifiers: list[Modifier] = None):
         self._modifiers: list[Modifier] = modifiers or []
+        # Group the modifiers by type in a single pass, keeping their original order.
+        self._modifiers_by_type: dict[ModifierType, list[Modifier]] = {t: [] for t in ModifierType}
+        for modifier in self._modifiers:
+            self._modifiers_by_type[modifier.modifier_type].append(modifier)
+        # Blank and merge modifiers are applied in the order of their placement, so sort them once.
+        for modifier_type in (ModifierType.BLANK, ModifierType.MERGE):
+            self._modifiers_by_type[modifier_type].sort(key=lambda m: m.placement.order_value)
 
     def _get_modifiers(self, modifier_type: ModifierType) -> list[Modifier]:
-        return [m for m in self._modifiers if m.modifier_type == modifier_type]
+        return list(self._modifiers_by_type[modifier_type])
 
     def get_blank_modifiers(self) -> list[BlankModifier]:
-        result = sorted(self._get_modifiers(ModifierType.BLANK), key=lambda m: m.placement.order_value)
+        result = self._get_modifiers(ModifierType.BLANK)
         return cast(list[BlankModifier], result)
 
     def get_frame_modifiers(self) -> list[FrameModifier]:
@@ -30,7 +37,7 @@ class Modifiers:
         return cast(list[FrameModifier], result)
 
     def get_merge_modifiers(self) -> list[MergeModifier]:
-        result = sorted(self._get_modifiers(ModifierType.MERGE), key=lambda m: m.placement.order_value)
+        result = self._get_modifiers(ModifierType.MERGE)
         return cast(list[MergeModifier], result)
 
     def get_closing_modifiers(self) -> list[ClosingModifier]:
@@ -7,7 +7,7 @@ from .placement import Placement
 from .room_offset import RoomOffset
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PathEnd:
     """
     Represents the end of a connected path.
@@ -46,20 +46,17 @@ class PathEnd:
         :return: A new path end.
         """
         offset = RoomOffset()
-        elements = text.split("/")
+        elements = iter(text.split("/"))
         is_dead_end = False
-        if not elements:
-            raise ValueError("You must specify at least the placement.")
-        placement = Placement.from_text(elements.pop(0))
-        if elements:
-            offset = RoomOffset.from_text(elements.pop(0))
-            if elements:
-                flags_text = elements.pop(0).lower()
-                if flags_text == "x":
+        placement = Placement.from_text(next(elements))
+        if (offset_text := next(elements, None)) is not None:
+            offset = RoomOffset.from_text(offset_text)
+            if (flags_text := next(elements, None)) is not None:
+                if flags_text.lower() == "x":
                     is_dead_end = True
                 else:
                     raise ValueError("The third parameter must be 'x' for a dead-end or omitted.")
-                if elements:
+                if next(elements, None) is not None:
                     raise ValueError("There are too many parameters.")
             if placement == Placement.RANDOM and not offset.is_zero:
                 raise ValueError("You must not set an offset for a random placement.")
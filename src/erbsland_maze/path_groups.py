@@ -6,9 +6,7 @@ class PathGroups:
     """
     Implementation of the union find algorithm to test for connected paths.
 
-    .. note::
-        This implementation is written for very small sets, as the `member_of` method will scan each
-        entry and find the root of it.
+    Each root keeps the set of its members, so groups can be listed without scanning all paths.
     """
 
     def __init__(self):
@@ -16,6 +14,7 @@ class PathGroups:
         Create a new ConnectedPaths object.
         """
         self.parent: dict[int, int] = {}
+        self.members: dict[int, set[int]] = {}  # The members of each group, indexed by the root.
 
     def are_connected(self, path_a: int, path_b: int) -> bool:
         """
@@ -34,11 +33,18 @@ class PathGroups:
         :param path_id: The path identifier to find.
         :return: The identifier of the group.
         """
-        if path_id not in self.parent:
-            self.parent[path_id] = path_id
-        if path_id != self.parent[path_id]:
-            self.parent[path_id] = self.find_root(self.parent[path_id])
-        return self.parent[path_id]
+        parent = self.parent
+        if path_id not in parent:
+            parent[path_id] = path_id
+            self.members[path_id] = {path_id}
+            return path_id
+        root = path_id
+        while parent[root] != root:
+            root = parent[root]
+        # Compress the path, so all visited nodes point directly to the root.
+        while parent[path_id] != root:
+            parent[path_id], path_id = root, parent[path_id]
+        return root
 
     def union(self, path_a: int, path_b: int) -> None:
         """
@@ -51,7 +57,11 @@ class PathGroups:
         root_x = self.find_root(path_a)
         root_y = self.find_root(path_b)
         if root_x != root_y:
+            # Attach the smaller group to the larger one, to keep the trees flat.
+            if len(self.members[root_x]) > len(self.members[root_y]):
+                root_x, root_y = root_y, root_x
             self.parent[root_x] = root_y
+            self.members[root_y] |= self.members.pop(root_x)
 
     def members_of(self, path_id) -> set[int]:
         """
@@ -60,11 +70,10 @@ class PathGroups:
         :param path_id: The identifier of the path.
         :return: A set with all the members of the path.
         """
-        root = self.find_root(path_id)
-        return {node for node in self.parent if self.find_root(node) == root}
+        return set(self.members[self.find_root(path_id)])
 
     def roots(self) -> set[int]:
         """
         Get all roots, and therefore all groups.
         """
-        return {self.find_root(node) for node in self.parent}
+        return set(self.members)
@@ -7,16 +7,23 @@ class PathPair:
     A pair of path identifiers that can be used as a key.
     """
 
+    __slots__ = ("_a", "_b", "_hash")
+
     def __init__(self, a: int, b: int):
         if a < 1 or b < 1 or a == b:
             raise ValueError("Invalid paths.")
         self._a = min(a, b)
         self._b = max(a, b)
+        self._hash = hash((self._a, self._b))  # Pairs are immutable, so the hash is calculated once.
 
     def __hash__(self) -> int:
-        return hash((self._a, self._b))
+        return self._hash
 
     def __eq__(self, other: "PathPair") -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, PathPair):
+            return False
         return self._a == other._a and self._b == other._b
 
     def __str__(self) -> str:
@@ -8,6 +8,19 @@ from typing import Tuple, Self
 from .room_location import RoomLocation
 from .room_size import RoomSize
 
+ALIAS_MAP: dict[str, str] = {
+    "w": "left",
+    "nw": "top_left",
+    "n": "top",
+    "ne": "top_right",
+    "e": "right",
+    "se": "bottom_right",
+    "s": "bottom",
+    "sw": "bottom_left",
+    "c": "center",
+    "r": "random",
+}
+
 
 class Placement(enum.StrEnum):
     """
@@ -29,28 +42,7 @@ class Placement(enum.StrEnum):
         """
         Get normals to detect the direction of this placement.
         """
-        match self:
-            case Placement.LEFT:
-                return -1, 0
-            case Placement.TOP_LEFT:
-                return -1, -1
-            case Placement.TOP:
-                return 0, -1
-            case Placement.TOP_RIGHT:
-                return 1, -1
-            case Placement.RIGHT:
-                return 1, 0
-            case Placement.BOTTOM_RIGHT:
-                return 1, 1
-            case Placement.BOTTOM:
-                return 0, 1
-            case Placement.BOTTOM_LEFT:
-                return -1, 1
-            case Placement.CENTER:
-                return 0, 0
-            case Placement.RANDOM:
-                return 0, 0
-        raise NotImplementedError("Placement not implemented")
+        return _DIRECTION_NORMALS[self]
 
     def placement_normals(self) -> Tuple[float, float]:
         """
@@ -109,56 +101,22 @@ class Placement(enum.StrEnum):
         """
         Return a value to order modifications in a sequence to case the least amount of conflicts.
         """
-        match self:
-            case Placement.LEFT:
-                return 208
-            case Placement.TOP_LEFT:
-                return 201
-            case Placement.TOP:
-                return 202
-            case Placement.TOP_RIGHT:
-                return 203
-            case Placement.RIGHT:
-                return 204
-            case Placement.BOTTOM_RIGHT:
-                return 205
-            case Placement.BOTTOM:
-                return 206
-            case Placement.BOTTOM_LEFT:
-                return 207
-            case Placement.CENTER:
-                return 100  # Place center first.
-            case Placement.RANDOM:
-                return 300  # Place random last.
+        return _ORDER_VALUES[self]
 
     @classmethod
     def alias_map(cls) -> dict[str, str]:
-        return {
-            "w": "left",
-            "nw": "top_left",
-            "n": "top",
-            "ne": "top_right",
-            "e": "right",
-            "se": "bottom_right",
-            "s": "bottom",
-            "sw": "bottom_left",
-            "c": "center",
-            "r": "random",
-        }
+        return dict(ALIAS_MAP)  # A copy, so callers cannot change the shared lookup tables.
 
     @classmethod
     def from_name(cls, name: str) -> Self:
-        alias_map = cls.alias_map()
-        if name in alias_map:
-            name = alias_map[name]
-        return cls(name)
+        placement = _NAME_MAP.get(name)
+        if placement is None:
+            raise ValueError(f"'{name}' is not a valid {cls.__name__}")
+        return placement
 
     @classmethod
     def all_names(cls) -> list[str]:
-        result = list(cls.alias_map().keys())
-        result.extend([str(x) for x in cls])
-        result.sort()
-        return result
+        return list(_ALL_NAMES)
 
     @classmethod
     def from_text(cls, text: str) -> Self:
@@ -167,6 +125,42 @@ class Placement(enum.StrEnum):
             raise ValueError("The placement parameter is empty.")
         try:
             return cls.from_name(text)
-        except KeyError or ValueError:
+        except (KeyError, ValueError):
             valid = ", ".join(cls.all_names())
             raise ValueError(f"The text '{text}' is not a valid placement name. Valid values are {valid}.")
+
+
+# The direction normals for each placement.
+_DIRECTION_NORMALS: dict[Placement, Tuple[int, int]] = {
+    Placement.LEFT: (-1, 0),
+    Placement.TOP_LEFT: (-1, -1),
+    Placement.TOP: (0, -1),
+    Placement.TOP_RIGHT: (1, -1),
+    Placement.RIGHT: (1, 0),
+    Placement.BOTTOM_RIGHT: (1, 1),
+    Placement.BOTTOM: (0, 1),
+    Placement.BOTTOM_LEFT: (-1, 1),
+    Placement.CENTER: (0, 0),
+    Placement.RANDOM: (0, 0),
+}
+
+# The order values for each placement.
+_ORDER_VALUES: dict[Placement, int] = {
+    Placement.LEFT: 208,
+    Placement.TOP_LEFT: 201,
+    Placement.TOP: 202,
+    Placement.TOP_RIGHT: 203,
+    Placement.RIGHT: 204,
+    Placement.BOTTOM_RIGHT: 205,
+    Placement.BOTTOM: 206,
+    Placement.BOTTOM_LEFT: 207,
+    Placement.CENTER: 100,  # Place center first.
+    Placement.RANDOM: 300,  # Place random last.
+}
+
+# Maps all aliases and values to the placements.
+_NAME_MAP: dict[str, Placement] = {x.value: x for x in Placement}
+_NAME_MAP.update({alias: Placement(value) for alias, value in ALIAS_MAP.items()})
+
+# All valid names, sorted for error messages.
+_ALL_NAMES: tuple[str, ...] = tuple(sorted(_NAME_MAP.keys()))
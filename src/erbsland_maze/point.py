@@ -1,11 +1,11 @@
 #  Copyright © 2003-2024 Tobias Erbsland. Web: https://erbsland.dev/
 #  SPDX-License-Identifier: GPL-3.0-or-later
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self
 
 
-@dataclass(order=True, frozen=True)
+@dataclass(order=True, frozen=True, slots=True)
 class Point:
     """
     A point.
@@ -17,6 +17,18 @@ class Point:
     y: float = 0.0
     """The y coordinate of the point."""
 
+    _key: tuple[int, int] = field(init=False, repr=False, compare=False)
+    """The rounded coordinates, used to compare and hash points."""
+
+    _hash: int = field(init=False, repr=False, compare=False)
+    """The precalculated hash of the point."""
+
+    def __post_init__(self):
+        # Points are immutable, so the rounded coordinates are only calculated once.
+        key = (int(round(self.x * 1_000_000)), int(round(self.y * 1_000_000)))
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_hash", hash(key))
+
     def __repr__(self):
         return f"Point({self.x:0.2f},{self.y:0.2f})"
 
@@ -36,16 +48,10 @@ class Point:
     def __eq__(self, other) -> bool:
         if not isinstance(other, Point):
             return False
-        x1 = int(round(self.x * 1_000_000))
-        y1 = int(round(self.y * 1_000_000))
-        x2 = int(round(other.x * 1_000_000))
-        y2 = int(round(other.y * 1_000_000))
-        return x1 == x2 and y1 == y2
+        return self._key == other._key
 
     def __hash__(self) -> int:
-        x1 = int(round(self.x * 1_000_000))
-        y1 = int(round(self.y * 1_000_000))
-        return hash((x1, y1))
+        return self._hash
 
     def translated(self, x: float = 0.0, y: float = 0.0) -> "Point":
         """
@@ -3,7 +3,6 @@
 
 from collections import defaultdict
 
-from .line import Line
 from .point import Point
 from .types import GenericLine
 
@@ -13,6 +12,8 @@ class PolyLine(GenericLine):
     A line that consists of multiple points, connected by straight lines.
     """
 
+    __slots__ = ("_points", "is_closed")
+
     def __init__(self, points: list[Point] = None, is_closed: bool = False):
         """
         Create a new polyline.
@@ -44,25 +45,30 @@ class PolyLine(GenericLine):
         :param line: The line to join.
         :return: `True` if the line was joined.
         """
-        if self.is_closed:
+        points = self._points
+        if self.is_closed or not points:
+            return False
+        # Read the end points only once, and stop at the first matching end.
+        line_points = line.points
+        if not line_points:
+            return False
+        first, last = points[0], points[-1]
+        line_first, line_last = line_points[0], line_points[-1]
+        # Modify the point list in place, instead of building a new list for each joined line.
+        if first == line_first:
+            points[:0] = reversed(line_points[1:])
+        elif first == line_last:
+            points[:0] = line_points[:-1]
+        elif last == line_first:
+            points.extend(line_points[1:])
+        elif last == line_last:
+            points.extend(reversed(line_points[:-1]))
+        else:
             return False
-        has_merge = False
-        if self.first == line.first:
-            self._points = list(reversed(line.points[1:])) + self._points
-            has_merge = True
-        elif self.first == line.last:
-            self._points = line.points[:-1] + self._points
-            has_merge = True
-        elif self.last == line.first:
-            self._points.extend(line.points[1:])
-            has_merge = True
-        elif self.last == line.last:
-            self._points.extend(list(reversed(line.points[:-1])))
-            has_merge = True
-        if has_merge and self.first == self.last:
-            self._points.pop()
+        if points[0] == points[-1]:
+            points.pop()
             self.is_closed = True
-        return has_merge
+        return True
 
     @classmethod
     def from_merged_lines(cls, lines: list[GenericLine]) -> list["PolyLine"]:
@@ -75,31 +81,33 @@ class PolyLine(GenericLine):
         """
         if not lines:
             return []
-        # First create a quick lookup table.
+        # First create a quick lookup table. Lines are removed from it, as soon as they are used.
         processed_lines: set[id] = set()
-        line_map: dict[Point, list[GenericLine]] = defaultdict(list)
+        line_map: dict[Point, dict[int, GenericLine]] = defaultdict(dict)
         for line in lines:
-            line_map[line.first].append(line)
-            line_map[line.last].append(line)
+            line_map[line.first][id(line)] = line
+            line_map[line.last][id(line)] = line
+
+        def remove_from_map(used_line: GenericLine) -> None:
+            processed_lines.add(id(used_line))
+            line_map[used_line.first].pop(id(used_line), None)
+            line_map[used_line.last].pop(id(used_line), None)
+
         result: list["PolyLine"] = []
         for start_line in lines:
             if id(start_line) in processed_lines:
                 continue
-            processed_lines.add(id(start_line))
+            remove_from_map(start_line)
             current_line = cls(start_line.points) if not isinstance(start_line, PolyLine) else start_line
-            is_extension_possible = True
-            while is_extension_possible:
-                is_extension_possible = False
-                for next_point in [current_line.first, current_line.last]:
-                    for next_line in line_map.get(next_point, []):
-                        if id(next_line) in processed_lines:
-                            continue  # Skip if already processed
-                        if current_line.join(next_line):
-                            processed_lines.add(id(next_line))
-                            is_extension_possible = True
-                            break  # Break to restart extension check
-                    if is_extension_possible:
-                        break  # Break to restart extension check
+            # Extend the start until no line fits, then the end. The start point only changes by joining lines at
+            # the start, and the lookup table only shrinks, so the start never has to be checked again.
+            for is_start in (True, False):
+                while True:
+                    next_point = current_line.first if is_start else current_line.last
+                    next_line = next(iter(line_map.get(next_point, {}).values()), None)
+                    if next_line is None or not current_line.join(next_line):
+                        break
+                    remove_from_map(next_line)
             result.append(current_line)
         return result
 
@@ -110,11 +118,12 @@ class PolyLine(GenericLine):
         if len(self._points) < 3:
             # If there are fewer than 3 points, no optimization is needed.
             return
-        optimized_points = [self._points[0]]
-        for index in range(len(self._points) - 2):
-            line1 = Line(self._points[index], self._points[index + 1])
-            line2 = Line(self._points[index + 1], self._points[index + 2])
-            if not line1.is_collinear_with(line2):
-                optimized_points.append(self._points[index + 1])
-        optimized_points.append(self._points[-1])
+        points = self._points
+        optimized_points = [points[0]]
+        # Test the point triples directly, instead of creating two lines for each of them. As the lines share the
+        # middle point, only the position of the last point has to be tested, like `Line.is_collinear_with` does.
+        for p1, p2, p3 in zip(points, points[1:], points[2:]):
+            if (p1.x - p2.x) * (p3.y - p1.y) - (p3.x - p1.x) * (p1.y - p2.y) != 0.0:
+                optimized_points.append(p2)
+        optimized_points.append(points[-1])
         self._points = optimized_points
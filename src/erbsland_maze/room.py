@@ -19,17 +19,21 @@ class Room:
     A room in the maze.
     """
 
+    __slots__ = ("grid", "type", "connections", "_connection_by_wall", "path_id", "path_length", "_walls")
+
     def __init__(self, location: RoomLocation) -> None:
         """
         Create a new 1x2 room.
 
         :param location: The location of the room.
         """
-        self.grid = LocationGrid(location, RoomSize(1, 1))
+        self.grid = LocationGrid(location, _SINGLE_ROOM_SIZE)
         self.type = RoomType.PATH  # The type of this room.
         self.connections: list[RoomConnection] = []  # The connections of this room.
+        self._connection_by_wall: dict[Wall, RoomConnection] = {}  # The connections, indexed by their local wall.
         self.path_id = 0  # The ID of the path. 0 = unused, 1-99 = primary paths, 100+ decoy paths.
         self.path_length = 0  # The length of the path.
+        self._walls: Optional[list[Wall]] = None  # The cached walls, cleared if the location or size changes.
 
     def __hash__(self) -> int:
         """
@@ -44,6 +48,7 @@ class Room:
     @location.setter
     def location(self, location: RoomLocation) -> None:
         self.grid.location = location
+        self._walls = None
 
     @property
     def size(self) -> RoomSize:
@@ -52,6 +57,7 @@ class Room:
     @size.setter
     def size(self, size: RoomSize) -> None:
         self.grid.size = size
+        self._walls = None
 
     @property
     def is_used(self) -> bool:
@@ -69,22 +75,24 @@ class Room:
         This test is used to check if a room is suitable for a start position. For example, if there is a frame around
         the maze, and the start position is in the corner, this will never work.
         """
-        return all(c.remote_room(self).type == RoomType.BLANK for c in self.connections)
+        return all(c.remote_room(self).type is RoomType.BLANK for c in self.connections)
 
-    def close_blocked_connections(self) -> None:
+    def close_blocked_connections(self) -> list[RoomConnection]:
         """
         Remove all connections from this room, that are blocked because they lead to already allocated paths.
+
+        :return: The remaining unused connections, that can be used to create a new path.
         """
-        blocked_connections = list(
-            [
-                connection
-                for connection in self.connections
-                if not connection.is_used and connection.remote_room(self).is_used
-            ]
-        )
-        for connection in blocked_connections:
-            connection.is_closed = True
-            connection.is_used = True
+        unused_connections: list[RoomConnection] = []
+        for connection in self.connections:
+            if connection.is_used:
+                continue
+            if connection.remote_room(self).is_used:
+                connection.is_closed = True
+                connection.is_used = True
+            else:
+                unused_connections.append(connection)
+        return unused_connections
 
     def unused_connections(self) -> list[RoomConnection]:
         """
@@ -94,6 +102,12 @@ class Room:
         """
         return [connection for connection in self.connections if not connection.is_used]
 
+    def has_unused_connections(self) -> bool:
+        """
+        Test if there are connections that can be potentially used to create a new path.
+        """
+        return any(not connection.is_used for connection in self.connections)
+
     def is_connected_to_room(self, room: "Room") -> bool:
         """
         Test if this room has a connection to another room.
@@ -113,11 +127,7 @@ class Room:
         :param wall: The wall.
         :return: The connection at the given wall or `None` if there isn't one.
         """
-        for connection in self.connections:
-            side = connection.local(self)
-            if side.wall == wall:
-                return connection
-        return None
+        return self._connection_by_wall.get(wall)
 
     def get_connections_in_direction(self, direction: Direction) -> list[RoomConnection]:
         """
@@ -167,9 +177,20 @@ class Room:
             ConnectionSide(target_room, remote_wall),
         )
         self.connections.append(new_connection)
+        self._connection_by_wall[local_wall] = new_connection
         if target_room.get_connection(remote_wall) is not None:
             raise ValueError("the remote room has already a connection back to this room.")
         target_room.connections.append(new_connection)
+        target_room._connection_by_wall[remote_wall] = new_connection
+
+    def set_connections(self, connections: list[RoomConnection]) -> None:
+        """
+        Replace all connections of this room.
+
+        :param connections: The new connections, which must already point to this room.
+        """
+        self.connections = connections
+        self._connection_by_wall = {connection.local(self).wall: connection for connection in connections}
 
     def remove_connection(self, connection: RoomConnection) -> None:
         """
@@ -179,7 +200,9 @@ class Room:
         """
         connected_room = connection.remote_room(self)
         connected_room.connections.remove(connection)
+        del connected_room._connection_by_wall[connection.local(connected_room).wall]
         self.connections.remove(connection)
+        del self._connection_by_wall[connection.local(self).wall]
 
     def _adjacent_exit_directions(self, location: RoomLocation) -> list[Direction]:
         """
@@ -200,21 +223,28 @@ class Room:
 
         :return: A list of walls.
         """
-        result: list[Wall] = []
-        for location in self.grid.all_frame_locations():
-            for direction in self._adjacent_exit_directions(location):
-                result.append(Wall(location, direction))
-        return result
+        if self._walls is None:
+            if self.size.is_one:
+                # Single rooms, the most common case, have a wall in every direction.
+                self._walls = [Wall(self.location, direction) for direction in Direction]
+            else:
+                self._walls = []
+                for location in self.grid.all_frame_locations():
+                    for direction in self._adjacent_exit_directions(location):
+                        self._walls.append(Wall(location, direction))
+        return list(self._walls)
 
     def remove_connections(self, closing: Closing):
-        matching_walls: list[Wall] = []
-        for wall in self.get_walls():
-            if wall.matches_closing_type(closing.closing_type, self.grid) != closing.invert:
-                matching_walls.append(wall)
-        for wall in matching_walls:
-            connection = self.get_connection(wall)
-            if connection:
-                self.remove_connection(connection)
+        # Only connections at the edge of the room have a wall that can match. The ones between the merged parts of
+        # a room lead back to this room and are skipped.
+        matching_connections: list[RoomConnection] = []
+        for connection in self.connections:
+            if connection.remote_room(self) is self:
+                continue
+            if connection.local(self).wall.matches_closing_type(closing.closing_type, self.grid) != closing.invert:
+                matching_connections.append(connection)
+        for connection in matching_connections:
+            self.remove_connection(connection)
 
     def remove_all_connections(self):
         """
@@ -231,3 +261,7 @@ class Room:
         self.path_length = 0
         for connection in self.connections:
             connection.reset()
+
+
+# The size of a new room. Room sizes are immutable, so all new rooms share this instance.
+_SINGLE_ROOM_SIZE = RoomSize(1, 1)
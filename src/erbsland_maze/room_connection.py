@@ -1,26 +1,32 @@
 #  Copyright © 2003-2024 Tobias Erbsland. Web: https://erbsland.dev/
 #  SPDX-License-Identifier: GPL-3.0-or-later
 
-from dataclasses import dataclass
-
 from .connection_side import ConnectionSide
 from .path_join_info import PathJoinInfo
 from .path_pair import PathPair
 
 
-@dataclass
 class RoomConnection:
     """
     A connection between two rooms.
     """
 
-    a: ConnectionSide
-    b: ConnectionSide
-    is_used = False
-    is_closed = False
+    __slots__ = ("a", "b", "is_used", "is_closed")
+
+    def __init__(self, a: ConnectionSide, b: ConnectionSide):
+        """
+        Create a new connection between two rooms.
+
+        :param a: The first side of the connection.
+        :param b: The second side of the connection.
+        """
+        self.a = a
+        self.b = b
+        self.is_used = False
+        self.is_closed = False
 
     def __hash__(self):
-        return id(self)  # Connections are unique regardless of its contents.
+        return id(self)  # Connections are unique regardless of its contents, and only equal to themselves.
 
     @property
     def connects_two_paths(self) -> bool:
@@ -58,7 +64,7 @@ class RoomConnection:
         :param my_room: My room to get the side of.
         :return: The connection side.
         """
-        if my_room == self.a.room:
+        if my_room is self.a.room:
             return self.a
         return self.b
 
@@ -69,7 +75,7 @@ class RoomConnection:
         :param my_room: My room, to get the remote side from.
         :return: The connection side.
         """
-        if my_room == self.a.room:
+        if my_room is self.a.room:
             return self.b
         return self.a
 
@@ -80,7 +86,9 @@ class RoomConnection:
         :param my_room: My room.
         :return: The remote room.
         """
-        return self.remote(my_room).room
+        if my_room is self.a.room:
+            return self.b.room
+        return self.a.room
 
     def replace_room(self, old_room: "Room", new_room: "Room") -> None:
         """
@@ -89,9 +97,9 @@ class RoomConnection:
         :param old_room: The old room.
         :param new_room: The new room.
         """
-        if self.a.room == old_room:
+        if self.a.room is old_room:
             self.a.room = new_room
-        if self.b.room == old_room:
+        if self.b.room is old_room:
             self.b.room = new_room
 
     def reset(self):
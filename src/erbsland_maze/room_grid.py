@@ -1,6 +1,7 @@
 #  Copyright © 2003-2024 Tobias Erbsland. Web: https://erbsland.dev/
 #  SPDX-License-Identifier: GPL-3.0-or-later
-from typing import Union
+from itertools import product
+from typing import Optional, Union
 
 from .blank_modifier import BlankModifier
 from .closing_modifier import ClosingModifier
@@ -31,7 +32,11 @@ class RoomGrid:
         :param size: The size for the room grid.
         """
         self._location_grid = LocationGrid(RoomLocation(0, 0), size)  # The rectangle with all locations.
-        self._room_map: dict[RoomLocation, Room] = {}  # A map with room locations pointing to the rooms.
+        self._locations = self._location_grid.all_locations()  # All locations, created once and shared by the rooms.
+        self._width = size.width
+        self._height = size.height
+        self._room_map: list[Optional[Room]] = [None] * (size.width * size.height)  # The rooms at `y * width + x`.
+        self._rooms: list[Room] = []  # All unique rooms, in the order they were created.
 
     def __getitem__(self, key: RoomLocation) -> Room:
         """
@@ -40,7 +45,10 @@ class RoomGrid:
         :param key: The room location.
         :return: The room.
         """
-        return self._room_map[key]
+        room = self._get_room(key.x, key.y)
+        if room is None:
+            raise KeyError(key)
+        return room
 
     def __contains__(self, key: RoomLocation) -> bool:
         """
@@ -49,7 +57,28 @@ class RoomGrid:
         :param key: The room location.
         :return: `True` if the room location exists.
         """
-        return key in self._room_map
+        return self._get_room(key.x, key.y) is not None
+
+    def _get_room(self, x: int, y: int) -> Optional[Room]:
+        """
+        Get the room at the given coordinates.
+
+        :param x: The x coordinate of the room location.
+        :param y: The y coordinate of the room location.
+        :return: The room, or `None` if there is no room at this location.
+        """
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return self._room_map[y * self._width + x]
+        return None
+
+    def _set_room(self, location: RoomLocation, room: Optional[Room]) -> None:
+        """
+        Place a room at the given location.
+
+        :param location: The room location, which must be inside the grid.
+        :param room: The room, or `None` to remove the room from this location.
+        """
+        self._room_map[location.y * self._width + location.x] = room
 
     @property
     def size(self) -> RoomSize:
@@ -59,19 +88,20 @@ class RoomGrid:
         """
         Get all room locations.
         """
-        return self._location_grid.all_locations()
+        return list(self._locations)
 
-    def get_all_rooms(self) -> set[Room]:
+    def get_all_rooms(self) -> list[Room]:
         """
         Get all unique rooms in this room grid.
         """
-        return {room for room in self._room_map.values()}
+        return list(self._rooms)
 
     def get_all_connections(self) -> set[RoomConnection]:
         """
         Get a list of all connections between the rooms.
         """
-        return {connection for room in self.get_all_rooms() for connection in room.connections}
+        # Iterate the rooms directly, the copy from `get_all_rooms` is not needed here.
+        return {connection for room in self._rooms for connection in room.connections}
 
     def get_join_candidates(self) -> list[RoomConnection]:
         """
@@ -128,23 +158,25 @@ class RoomGrid:
         """
         Fill the room grid with unused, unconnected 1x1 rooms.
         """
-        for location in self.get_all_locations():
-            self._room_map[location] = Room(location)
+        for location in self._locations:
+            room = Room(location)
+            self._set_room(location, room)
+            self._rooms.append(room)
 
     def connect_all_rooms(self) -> None:
         """
         Create logical connections between all rooms.
         """
-        for location in self.get_all_locations():
-            room = self._room_map[location]
-            for direction in Direction:
-                target_location = location.advance(direction)
-                if target_location not in self._room_map:
-                    continue
-                target_room = self._room_map[target_location]
-                if room.is_connected_to_room(target_room):
-                    continue
-                room.add_connection(location, direction, target_room)
+        # Each pair of neighbours is only visited once, from the room to the west or north of it. As the grid is
+        # completely filled at this point, the neighbours are read from the room map by their index.
+        width = self._width
+        for location in self._locations:
+            index = location.y * width + location.x
+            room = self._room_map[index]
+            if location.x + 1 < width:
+                room.add_connection(location, Direction.EAST, self._room_map[index + 1])
+            if location.y + 1 < self._height:
+                room.add_connection(location, Direction.SOUTH, self._room_map[index + width])
 
     def merge_area(self, grid: LocationGrid):
         """
@@ -154,39 +186,43 @@ class RoomGrid:
         """
         if grid.size.width < 2 or grid.size.height < 2:
             raise ValueError("Merged area must be at least 2x2 units.")
-        room = self._room_map[grid.location]
-        merged_rooms: set[Room] = set()
-        all_connections: set[RoomConnection] = set()
-        all_connections.update(room.connections)
-        for merged_room in [self._room_map.get(l) for l in grid.all_locations() if l != room.location]:
+        room = self[grid.location]
+        # Collect and validate all rooms first, so a failed merge leaves the grid unchanged.
+        area_rooms: list[Room] = []
+        # Walk the coordinates of the area, instead of creating a location object for each of them.
+        x_values = range(grid.location.x, grid.location.x + grid.size.width)
+        y_values = range(grid.location.y, grid.location.y + grid.size.height)
+        for x, y in product(x_values, y_values):
+            if x == room.location.x and y == room.location.y:
+                continue
+            merged_room = self._get_room(x, y)
             if merged_room is None:
                 raise ValueError("Cannot merge area, overlaps with already merged rooms, or edge of maze.")
             if not merged_room.size.is_one:
                 raise ValueError("Cannot merge area, overlaps with already merged rooms, or edge of maze.")
-            merged_rooms.add(merged_room)
-            all_connections.update(merged_room.connections)
+            area_rooms.append(merged_room)
+        merged_rooms: set[Room] = set(area_rooms)
+        for merged_room in area_rooms:
             if room.type == RoomType.BLANK and merged_room.type == RoomType.PATH:
                 room.type = merged_room.type
             if merged_room.type == RoomType.END:
                 room.type = merged_room.type
             if room.path_id == 0 and merged_room.path_id > 0:
                 room.path_id = merged_room.path_id
-        # Keep all connections that connect the room edges.
-        connections_to_keep: set[RoomConnection] = set()
-        for c in all_connections:
-            ra, rb = c.a.room, c.b.room
-            if ra not in merged_rooms or rb not in merged_rooms:
-                connections_to_keep.add(c)
         # Now expand this room.
         room.size = grid.size
-        # Move all connections into this room and make that they point to this room.
+        # Keep all connections that connect the room edges, and make them point to this room. The connections
+        # between the merged rooms are dropped, as they make no sense anymore.
+        connections = [c for c in room.connections if c.a.room not in merged_rooms or c.b.room not in merged_rooms]
         for merged_room in merged_rooms:
-            for connection in [c for c in merged_room.connections if c in connections_to_keep]:
+            for connection in merged_room.connections:
+                if connection.a.room in merged_rooms and connection.b.room in merged_rooms:
+                    continue
                 connection.replace_room(merged_room, room)
-                room.connections.append(connection)
-            self._room_map[merged_room.location] = room
-        # Filter out/delete the merged connections as they make no sense anymore.
-        room.connections = [c for c in room.connections if c in connections_to_keep]
+                connections.append(connection)
+            self._set_room(merged_room.location, room)
+        self._rooms = [r for r in self._rooms if r not in merged_rooms]
+        room.set_connections(connections)
         return merged_rooms
 
     def apply_blank_modifiers(self, modifiers: list[Union[BlankModifier, FrameModifier]]) -> None:
@@ -195,7 +231,7 @@ class RoomGrid:
         """
         for modifier in modifiers:
             for location in self.get_all_locations_for_modifier(modifier):
-                self._room_map[location].type = RoomType.BLANK
+                self[location].type = RoomType.BLANK
 
     def apply_closing_modifiers(self, modifiers: list[ClosingModifier]) -> None:
         """
@@ -203,7 +239,7 @@ class RoomGrid:
         """
         for modifier in modifiers:
             for location in self.get_all_locations_for_modifier(modifier):
-                self._room_map[location].remove_connections(modifier.closing)
+                self[location].remove_connections(modifier.closing)
 
     def _try_apply_merge_modifier(self, modifier: Modifier) -> None:
         """
@@ -212,9 +248,9 @@ class RoomGrid:
         :param modifier: The modifier to apply.
         """
         grid = self.location_grid_for_modifier(modifier)
-        if all(self._room_map[location].type == RoomType.BLANK for location in grid.all_locations()):
+        if all(self[location].type == RoomType.BLANK for location in grid.all_locations()):
             raise ModifierError(modifier, f"The merge modifier tries to merge room in a blank space.")
-        if any(not self._room_map[location].size.is_one for location in grid.all_locations()):
+        if any(not self[location].size.is_one for location in grid.all_locations()):
             raise ModifierError(modifier, f"The merge modifier overlaps with already merged rooms.")
         self.merge_area(grid)
 
@@ -245,15 +281,18 @@ class RoomGrid:
         """
         Remove all rooms that are marked as blanks.
         """
-        rooms_to_remove = list([room for room in self.get_all_rooms() if room.type == RoomType.BLANK])
+        rooms_to_remove = [room for room in self._rooms if room.type == RoomType.BLANK]
         for room in rooms_to_remove:
             room.remove_all_connections()
         for room in rooms_to_remove:
-            del self._room_map[room.location]
+            self._set_room(room.location, None)
+        self._rooms = [room for room in self._rooms if room.type != RoomType.BLANK]
 
     def reset_rooms_and_connections(self) -> None:
         """
         Reset all rooms and connections to another attempt.
         """
-        for room in self.get_all_rooms():
-            room.reset()
+        # Connections are only ever changed from a used room, so untouched rooms can be skipped.
+        for room in self._rooms:
+            if room.is_used:
+                room.reset()
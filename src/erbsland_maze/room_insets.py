@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Self
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomInsets:
     """
     Room location insets.
@@ -31,7 +31,7 @@ class RoomInsets:
         :return: The resulting value.
         """
         try:
-            value = int(text[0], base=10)
+            value = int(text, base=10)
         except ValueError:
             raise ValueError("The given text is not a valid inset.")
         if value < 0 or value >= 10_000:
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from .direction import Direction
 
 
-@dataclass(order=True, frozen=True)
+@dataclass(order=True, frozen=True, slots=True)
 class RoomLocation:
     """
     The location of a room in room units.
@@ -18,6 +18,15 @@ class RoomLocation:
     y: int = 0
     """The y coordinate of the room."""
 
+    def __eq__(self, other) -> bool:
+        # Written by hand, as locations are compared and hashed for every lookup in the room map.
+        if other.__class__ is not RoomLocation:
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return self.x * 1_000_003 ^ self.y
+
     def advance(self, direction: Direction) -> "RoomLocation":
         """
         Get a new room location that is in the given direction.
@@ -25,15 +34,8 @@ class RoomLocation:
         :param direction: The direction.
         :return: The new room location.
         """
-        match direction:
-            case Direction.NORTH:
-                return RoomLocation(self.x, self.y - 1)
-            case Direction.EAST:
-                return RoomLocation(self.x + 1, self.y)
-            case Direction.SOUTH:
-                return RoomLocation(self.x, self.y + 1)
-            case Direction.WEST:
-                return RoomLocation(self.x - 1, self.y)
+        dx, dy = _DIRECTION_DELTAS[direction]
+        return RoomLocation(self.x + dx, self.y + dy)
 
     def __sub__(self, other: "RoomLocation") -> "RoomLocation":
         if not isinstance(other, RoomLocation):
@@ -69,15 +71,16 @@ class RoomLocation:
         :param text: The text to parse.
         :return: The room location.
         """
-        if "," not in text:
-            raise ValueError(f"The given text is not a valid room location.")
-        text_parts = text.split(",")
-        if len(text_parts) != 2:
+        text_x, separator, text_y = text.partition(",")
+        if not separator or "," in text_y:
             raise ValueError(f"The given text is not a valid room location.")
-        text_x, text_y = text_parts
         try:
             value_x = int(text_x, base=10)
             value_y = int(text_y, base=10)
         except ValueError:
             raise ValueError("The given text is not a valid room location.")
         return cls(value_x, value_y)
+
+
+# The location deltas for one step, indexed by the direction value.
+_DIRECTION_DELTAS = ((0, -1), (1, 0), (0, 1), (-1, 0))
@@ -7,7 +7,7 @@ from .placement import Placement
 from .room_location import RoomLocation
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoomOffset:
 
     x: int = 0
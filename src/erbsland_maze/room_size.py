@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Self
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoomSize:
     """
     The size of a room in room units.
@@ -33,15 +33,10 @@ class RoomSize:
         :return: A room size.
         """
         text = text.lower()
-        if text == "single":
-            return cls(1, 1)
-        if text == "small":
-            return cls(2, 2)
-        if text == "medium":
-            return cls(3, 3)
-        if text == "large":
-            return cls(4, 4)
-        if "x" not in text:
+        if named_size := _NAMED_SIZES.get(text):
+            return cls(*named_size)
+        text_x, separator, text_y = text.partition("x")
+        if not separator:
             try:
                 value = int(text, base=10)
             except ValueError:
@@ -49,10 +44,8 @@ class RoomSize:
             if value < 1 or value >= 10_000:
                 raise ValueError("The given text is not a valid room size.")
             return cls(value, value)
-        text_parts = text.split("x")
-        if len(text_parts) != 2:
+        if "x" in text_y:
             raise ValueError("The given text is not a valid room size.")
-        text_x, text_y = text_parts
         try:
             value_x = int(text_x.strip(), base=10)
             value_y = int(text_y.strip(), base=10)
@@ -61,3 +54,7 @@ class RoomSize:
         if value_x < 1 or value_x >= 10_000 or value_y < 1 or value_y >= 10_000:
             raise ValueError("The given text is not a valid room size.")
         return cls(value_x, value_y)
+
+
+# The room sizes that can be specified by name.
+_NAMED_SIZES: dict[str, tuple[int, int]] = {"single": (1, 1), "small": (2, 2), "medium": (3, 3), "large": (4, 4)}
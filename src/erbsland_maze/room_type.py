@@ -3,7 +3,7 @@
 import enum
 
 
-class RoomType(enum.Enum):
+class RoomType(enum.IntEnum):
     """
     The type of room.
     """
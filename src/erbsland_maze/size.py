@@ -10,7 +10,7 @@ from .point import Point
 from .room_size import RoomSize
 
 
-@dataclass(order=True, frozen=True)
+@dataclass(order=True, frozen=True, slots=True)
 class Size:
     """
     A graphical size.
@@ -69,9 +69,9 @@ class Size:
         :return: The ideal number of sections with the given parity.
         """
         if parity == Parity.NONE:
-            result = int(floor(total_length / side_length))
+            result = floor(total_length / side_length)
         else:
-            result = int(floor(total_length / side_length / 2)) * 2
+            result = floor(total_length / side_length / 2) * 2
             if parity == Parity.ODD:
                 result -= 1
         return result
@@ -4,7 +4,6 @@
 import enum
 from typing import Self
 
-
 ALIAS_MAP: dict[str, str] = {
     "se": "stretch_edge",
     "s": "stretch",
@@ -65,28 +64,26 @@ class SvgFillMode(enum.StrEnum):
         """
         Tests if this value scales the room, proportionally or not.
         """
-        return self not in [self.FIXED_CENTER, self.FIXED_TOP_LEFT]
+        return self in _ROOM_SCALING_MODES
 
     def does_proportionally_scale_room(self) -> bool:
         """
         Tests if this value scales the room size to fill the area.
         """
-        return self in [self.STRETCH_EDGE, self.SQUARE_TOP_LEFT, self.SQUARE_CENTER]
+        return self in _PROPORTIONAL_SCALING_MODES
 
     def does_center_rooms(self) -> bool:
         """
         Tests if this value centers the room.
         """
-        return self in [self.STRETCH_EDGE, self.SQUARE_CENTER, self.FIXED_CENTER]
+        return self in _CENTERING_MODES
 
     @classmethod
     def get_all_names(cls) -> list[str]:
         """
         Get all possible names for the fill modes.
         """
-        result = [str(x) for x in cls]
-        result.extend(ALIAS_MAP.keys())
-        return sorted(result)
+        return list(_ALL_NAMES)
 
     @classmethod
     def from_name(cls, name: str) -> Self:
@@ -96,10 +93,10 @@ class SvgFillMode(enum.StrEnum):
         :param name: The name.
         :return: The enum value.
         """
-        name = name.lower()
-        if name in ALIAS_MAP:
-            name = ALIAS_MAP[name]
-        return cls(name)
+        fill_mode = _NAME_MAP.get(name.lower())
+        if fill_mode is None:
+            raise ValueError(f"'{name}' is not a valid {cls.__name__}")
+        return fill_mode
 
     @classmethod
     def from_text(cls, text: str) -> Self:
@@ -114,6 +111,25 @@ class SvgFillMode(enum.StrEnum):
             raise ValueError("The fill mode parameter is empty.")
         try:
             return cls.from_name(text)
-        except KeyError or ValueError:
+        except (KeyError, ValueError):
             valid = ", ".join(cls.get_all_names())
             raise ValueError(f"The text '{text}' is not a valid fill mode. Valid values are {valid}.")
+
+
+# The fill modes that scale the room size, proportionally or not.
+_ROOM_SCALING_MODES = frozenset(SvgFillMode) - {SvgFillMode.FIXED_CENTER, SvgFillMode.FIXED_TOP_LEFT}
+
+# The fill modes that scale the room size to fill the area.
+_PROPORTIONAL_SCALING_MODES = frozenset(
+    {SvgFillMode.STRETCH_EDGE, SvgFillMode.SQUARE_TOP_LEFT, SvgFillMode.SQUARE_CENTER}
+)
+
+# The fill modes that center the rooms.
+_CENTERING_MODES = frozenset({SvgFillMode.STRETCH_EDGE, SvgFillMode.SQUARE_CENTER, SvgFillMode.FIXED_CENTER})
+
+# Maps all aliases and values to the fill modes.
+_NAME_MAP: dict[str, SvgFillMode] = {x.value: x for x in SvgFillMode}
+_NAME_MAP.update({alias: SvgFillMode(value) for alias, value in ALIAS_MAP.items()})
+
+# All valid names, sorted for error messages.
+_ALL_NAMES: tuple[str, ...] = tuple(sorted(_NAME_MAP.keys()))
@@ -2,6 +2,7 @@
 #  SPDX-License-Identifier: GPL-3.0-or-later
 
 from colorsys import hsv_to_rgb
+from operator import attrgetter
 from pathlib import Path
 from typing import Tuple
 
@@ -23,6 +24,9 @@ from .svg_zero_point import SvgZeroPoint
 from .wall import Wall
 from .wall_points import WallPoints
 
+_HORIZONTAL_KEY = attrgetter("inset1.x")  # Sort key for wall points along the top and bottom side.
+_VERTICAL_KEY = attrgetter("inset1.y")  # Sort key for wall points along the left and right side.
+
 
 class SvgLayout(Layout):
     """
@@ -50,6 +54,7 @@ class SvgLayout(Layout):
         else:
             self._svg_scale_factor = 1.0
         self._svg_offset: Point = Point()
+        self._wall_inset = self.setup.wall_thickness / 2  # The distance from the room edge to the wall line.
 
     def _check_count_limits(self, count, dimension):
         """
@@ -76,7 +81,7 @@ class SvgLayout(Layout):
         :param stretch_to_length: If supplied, the first and last value are stretched to fill the whole length.
         :return: A list of edge coordinates.
         """
-        result = list([offset + (x * side_length) for x in range(count + 1)])
+        result = [offset + (x * side_length) for x in range(count + 1)]
         if stretch_to_length is not None:
             result[0] = 0.0
             result[-1] = stretch_to_length
@@ -161,6 +166,50 @@ class SvgLayout(Layout):
         y2 = self._y_values[room.location.y + room.size.height]
         return Rectangle(Point(x1, y1), Size(x2 - x1, y2 - y1))
 
+    def _get_location_wall_points(self, location: RoomLocation) -> tuple[WallPoints, ...]:
+        """
+        Get the wall points for all four walls at the given location.
+
+        :param location: The room location.
+        :return: The wall points, indexed by the direction of the wall.
+        """
+        x1 = self._x_values[location.x]
+        x2 = self._x_values[location.x + 1]
+        y1 = self._y_values[location.y]
+        y2 = self._y_values[location.y + 1]
+        inset = self._wall_inset
+        # The inset corners are shared by the two walls that meet there.
+        top_left = Point(x1 + inset, y1 + inset)
+        top_right = Point(x2 - inset, y1 + inset)
+        bottom_left = Point(x1 + inset, y2 - inset)
+        bottom_right = Point(x2 - inset, y2 - inset)
+        return (
+            WallPoints(
+                adjacent1=Point(x1 + inset, y1),
+                inset1=top_left,
+                adjacent2=Point(x2 - inset, y1),
+                inset2=top_right,
+            ),
+            WallPoints(
+                adjacent1=Point(x2, y1 + inset),
+                inset1=top_right,
+                adjacent2=Point(x2, y2 - inset),
+                inset2=bottom_right,
+            ),
+            WallPoints(
+                adjacent1=Point(x1 + inset, y2),
+                inset1=bottom_left,
+                adjacent2=Point(x2 - inset, y2),
+                inset2=bottom_right,
+            ),
+            WallPoints(
+                adjacent1=Point(x1, y1 + inset),
+                inset1=top_left,
+                adjacent2=Point(x1, y2 - inset),
+                inset2=bottom_left,
+            ),
+        )
+
     def get_wall_points(self, wall: Wall) -> WallPoints:
         """
         Get a set of points for that are used to draw the lines for the situation at the given wall.
@@ -168,107 +217,80 @@ class SvgLayout(Layout):
         :param wall: The wall for the points.
         :return: The points at this wall.
         """
-        rect = self.get_location_rectangle(wall.location)
-        inset = self.setup.wall_thickness / 2
-        match wall.direction:
-            case Direction.NORTH:
-                return WallPoints(
-                    adjacent1=rect.top_left.translated(x=inset),
-                    inset1=rect.top_left.translated(x=inset, y=inset),
-                    adjacent2=rect.top_right.translated(x=-inset),
-                    inset2=rect.top_right.translated(x=-inset, y=inset),
-                )
-            case Direction.EAST:
-                return WallPoints(
-                    adjacent1=rect.top_right.translated(y=inset),
-                    inset1=rect.top_right.translated(x=-inset, y=inset),
-                    adjacent2=rect.bottom_right.translated(y=-inset),
-                    inset2=rect.bottom_right.translated(x=-inset, y=-inset),
-                )
-            case Direction.SOUTH:
-                return WallPoints(
-                    adjacent1=rect.bottom_left.translated(x=inset),
-                    inset1=rect.bottom_left.translated(x=inset, y=-inset),
-                    adjacent2=rect.bottom_right.translated(x=-inset),
-                    inset2=rect.bottom_right.translated(x=-inset, y=-inset),
-                )
-            case Direction.WEST:
-                return WallPoints(
-                    adjacent1=rect.top_left.translated(y=inset),
-                    inset1=rect.top_left.translated(x=inset, y=inset),
-                    adjacent2=rect.bottom_left.translated(y=-inset),
-                    inset2=rect.bottom_left.translated(x=inset, y=-inset),
-                )
-
-    @staticmethod
-    def _horizontal_sort(wall: Wall) -> int:
-        """
-        Helper function for a horizontal sort.
-        """
-        return wall.location.x
+        location = wall.location
+        return _WALL_POINTS_BUILDERS[wall.direction](
+            self._x_values[location.x],
+            self._y_values[location.y],
+            self._x_values[location.x + 1],
+            self._y_values[location.y + 1],
+            self._wall_inset,
+        )
 
     @staticmethod
-    def _vertical_sort(wall: Wall) -> int:
-        """
-        Helper function for a vertical sort.
-        """
-        return wall.location.x
-
-    def _intermediate_lines(self, all_walls: list[Wall], direction: Direction) -> list[Line]:
+    def _intermediate_lines(wall_points: list[WallPoints]) -> list[Line]:
         """
         Get intermediate lines of a room. These are the lines between the doors or walls at the sides of the room.
 
-        :param all_walls: All walls of the room.
-        :param direction: The direction, which walls shall generate lines..
+        :param wall_points: The points of the walls at one side of the room, sorted along this side.
         :return: A list of lines.
         """
-        if direction == Direction.NORTH or direction == Direction.SOUTH:
-            key_fn = self._horizontal_sort
-        else:
-            key_fn = self._vertical_sort
-        walls = list(sorted([wall for wall in all_walls if wall.direction == direction], key=key_fn))
-        lines: list[Line] = []
-        for i in range(len(walls) - 1):
-            wp1 = self.get_wall_points(walls[i])
-            wp2 = self.get_wall_points(walls[i + 1])
-            lines.append(Line(wp1.inset2, wp2.inset1))
-        return lines
+        return [Line(points1.inset2, points2.inset1) for points1, points2 in zip(wall_points, wall_points[1:])]
 
-    def get_lines_for_room(self, room: Room) -> list[PolyLine]:
+    def _get_raw_lines_for_room(self, room: Room) -> list[Line]:
         """
-        Get all lines for a single room.
+        Get all the individual lines for a single room, before they are merged.
 
         :param room: The room to get the lines for.
-        :return: A list of polylines for that room.
+        :return: A list of lines for that room.
         """
         lines: list[Line] = []
         walls = room.get_walls()
-        if room.size.width > 1:
-            lines.extend(self._intermediate_lines(walls, Direction.NORTH))
-            lines.extend(self._intermediate_lines(walls, Direction.SOUTH))
-        if room.size.height > 1:
-            lines.extend(self._intermediate_lines(walls, Direction.WEST))
-            lines.extend(self._intermediate_lines(walls, Direction.EAST))
-        for wall in walls:
-            wall_points = self.get_wall_points(wall)
+        if not room.size.is_one:
+            # Calculate the points of each wall only once, for the intermediate lines and the wall lines.
+            wall_points_list = [self.get_wall_points(wall) for wall in walls]
+            side_points: dict[Direction, list[WallPoints]] = {direction: [] for direction in Direction}
+            for wall, wall_points in zip(walls, wall_points_list):
+                side_points[wall.direction].append(wall_points)
+            if room.size.width > 1:
+                lines.extend(self._intermediate_lines(sorted(side_points[Direction.NORTH], key=_HORIZONTAL_KEY)))
+                lines.extend(self._intermediate_lines(sorted(side_points[Direction.SOUTH], key=_HORIZONTAL_KEY)))
+            if room.size.height > 1:
+                lines.extend(self._intermediate_lines(sorted(side_points[Direction.WEST], key=_VERTICAL_KEY)))
+                lines.extend(self._intermediate_lines(sorted(side_points[Direction.EAST], key=_VERTICAL_KEY)))
+        else:
+            # Single rooms use all four walls at their location, so the points are calculated together.
+            location_wall_points = self._get_location_wall_points(room.location)
+            wall_points_list = [location_wall_points[wall.direction] for wall in walls]
+        for wall, wall_points in zip(walls, wall_points_list):
             if room.is_open_connection(wall):
                 lines.append(Line(wall_points.inset1, wall_points.adjacent1))
                 lines.append(Line(wall_points.inset2, wall_points.adjacent2))
             else:
                 lines.append(Line(wall_points.inset1, wall_points.inset2))
-        return PolyLine.from_merged_lines(lines)
+        return lines
+
+    def get_lines_for_room(self, room: Room) -> list[PolyLine]:
+        """
+        Get all lines for a single room.
+
+        :param room: The room to get the lines for.
+        :return: A list of polylines for that room.
+        """
+        return PolyLine.from_merged_lines(self._get_raw_lines_for_room(room))
 
     def get_all_lines(self, rooms: list[Room]) -> list[PolyLine]:
         """
         Get all lines for the given rooms.
 
+        The lines of all rooms are merged in one pass, so polylines continue across the room boundaries.
+
         :param rooms: The rooms to get the lines from.
         :return: A list of polylines for the given rooms.
         """
-        lines: list[PolyLine] = []
+        lines: list[Line] = []
         for room in rooms:
-            lines.extend(self.get_lines_for_room(room))
-        return lines
+            lines.extend(self._get_raw_lines_for_room(room))
+        return PolyLine.from_merged_lines(lines)
 
     def convert_value_to_svg(self, value: float) -> float:
         """
@@ -315,12 +337,15 @@ class SvgLayout(Layout):
         """
         if not polyline.points:
             return
-        for index, point in enumerate(polyline.points):
-            point = self.convert_point_to_svg(point)
-            if index == 0:
-                ctx.move_to(point.x, point.y)
-            else:
-                ctx.line_to(point.x, point.y)
+        # Same conversion as `convert_point_to_svg`, without creating two points per vertex.
+        scale = self._svg_scale_factor
+        offset_x = self._svg_offset.x
+        offset_y = self._svg_offset.y
+        first_point, *other_points = polyline.points
+        ctx.move_to(first_point.x * scale + offset_x, first_point.y * scale + offset_y)
+        line_to = ctx.line_to  # Resolve the method once for all vertices.
+        for point in other_points:
+            line_to(point.x * scale + offset_x, point.y * scale + offset_y)
         if polyline.is_closed:
             ctx.close_path()
 
@@ -335,7 +360,7 @@ class SvgLayout(Layout):
         """
         ctx.set_source_rgb(*color)
         path_width = max(self._room_size.width, self._room_size.height) - self.setup.wall_thickness
-        inset = self.setup.wall_thickness / 2
+        inset = self._wall_inset
         if room.size.width > 2 and room.size.height > 2:
             inset += path_width
         elif path_width > self.setup.wall_thickness:
@@ -347,8 +372,7 @@ class SvgLayout(Layout):
         ctx.fill()
 
     def render_image(self, file_path: Path, rooms: list[Room], path_end_rooms: list[Room]) -> None:
-        all_room_lines = self.get_all_lines(rooms)
-        polylines = PolyLine.from_merged_lines(all_room_lines)
+        polylines = self.get_all_lines(rooms)
         for polyline in polylines:
             polyline.optimize()
         with cairo.SVGSurface(
@@ -375,16 +399,71 @@ class SvgLayout(Layout):
             ctx.set_source_rgb(0.2, 0.2, 0.2)
             ctx.set_fill_rule(cairo.FILL_RULE_EVEN_ODD)
             ctx.set_line_width(self.convert_value_to_svg(0.1))
-            closed_polylines = [polyline for polyline in polylines if polyline.is_closed]
+            closed_polylines: list[PolyLine] = []
+            open_polylines: list[PolyLine] = []
+            for polyline in polylines:
+                (closed_polylines if polyline.is_closed else open_polylines).append(polyline)
             if closed_polylines:
                 for polyline in closed_polylines:
                     self._paint_polyline(ctx, polyline)
                 ctx.fill()
-            open_polylines = [polyline for polyline in polylines if not polyline.is_closed]
             if open_polylines:
+                # Stroke all open polylines as subpaths of a single path.
                 for polyline in open_polylines:
                     self._paint_polyline(ctx, polyline)
-                    ctx.stroke()
+                ctx.stroke()
             for index, room in enumerate(path_end_rooms):
                 color = hsv_to_rgb(index / (len(path_end_rooms) + 1), 0.5, 0.8)
                 self._paint_room_mark(ctx, room, color)
+
+
+def _north_wall_points(x1: float, y1: float, x2: float, y2: float, inset: float) -> WallPoints:
+    """
+    Build the points for the wall at the north side of a location.
+    """
+    return WallPoints(
+        adjacent1=Point(x1 + inset, y1),
+        inset1=Point(x1 + inset, y1 + inset),
+        adjacent2=Point(x2 - inset, y1),
+        inset2=Point(x2 - inset, y1 + inset),
+    )
+
+
+def _east_wall_points(x1: float, y1: float, x2: float, y2: float, inset: float) -> WallPoints:
+    """
+    Build the points for the wall at the east side of a location.
+    """
+    return WallPoints(
+        adjacent1=Point(x2, y1 + inset),
+        inset1=Point(x2 - inset, y1 + inset),
+        adjacent2=Point(x2, y2 - inset),
+        inset2=Point(x2 - inset, y2 - inset),
+    )
+
+
+def _south_wall_points(x1: float, y1: float, x2: float, y2: float, inset: float) -> WallPoints:
+    """
+    Build the points for the wall at the south side of a location.
+    """
+    return WallPoints(
+        adjacent1=Point(x1 + inset, y2),
+        inset1=Point(x1 + inset, y2 - inset),
+        adjacent2=Point(x2 - inset, y2),
+        inset2=Point(x2 - inset, y2 - inset),
+    )
+
+
+def _west_wall_points(x1: float, y1: float, x2: float, y2: float, inset: float) -> WallPoints:
+    """
+    Build the points for the wall at the west side of a location.
+    """
+    return WallPoints(
+        adjacent1=Point(x1, y1 + inset),
+        inset1=Point(x1 + inset, y1 + inset),
+        adjacent2=Point(x1, y2 - inset),
+        inset2=Point(x1 + inset, y2 - inset),
+    )
+
+
+# The functions that build the wall points from the edges of a location, indexed by the direction value.
+_WALL_POINTS_BUILDERS = (_north_wall_points, _east_wall_points, _south_wall_points, _west_wall_points)
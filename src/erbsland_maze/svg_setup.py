@@ -10,7 +10,7 @@ from .svg_unit import SvgUnit
 from .svg_zero_point import SvgZeroPoint
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SvgSetup:
     """
     The setup for the SVG layout.
@@ -5,6 +5,7 @@ from typing import Protocol
 
 
 class GenericLine(Protocol):
+    __slots__ = ()
 
     @property
     def first(self) -> "Point":
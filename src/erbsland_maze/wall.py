@@ -1,7 +1,7 @@
 #  Copyright © 2003-2024 Tobias Erbsland. Web: https://erbsland.dev/
 #  SPDX-License-Identifier: GPL-3.0-or-later
 
-from dataclasses import dataclass
+from typing import NamedTuple
 
 from .closing_type import ClosingType
 from .corner import Corner
@@ -10,10 +10,12 @@ from .location_grid import LocationGrid
 from .room_location import RoomLocation
 
 
-@dataclass(order=True, frozen=True)
-class Wall:
+class Wall(NamedTuple):
     """
     A wall in a room.
+
+    Walls are used as keys for the connections of a room. As a named tuple, they are hashed and compared by the
+    built-in tuple methods.
     """
 
     location: RoomLocation
@@ -42,17 +44,17 @@ class Wall:
             case ClosingType.CORNER_BOTTOM_LEFT:
                 return grid.is_corner(self.location, Corner.BOTTOM_LEFT)
             case ClosingType.DIRECTION_WEST:
-                return self.direction == Direction.WEST
+                return self.direction is Direction.WEST
             case ClosingType.DIRECTION_NORTH:
-                return self.direction == Direction.NORTH
+                return self.direction is Direction.NORTH
             case ClosingType.DIRECTION_EAST:
-                return self.direction == Direction.EAST
+                return self.direction is Direction.EAST
             case ClosingType.DIRECTION_SOUTH:
-                return self.direction == Direction.SOUTH
+                return self.direction is Direction.SOUTH
             case ClosingType.DIRECTION_HORIZONTAL:
-                return self.direction == Direction.WEST or self.direction == Direction.EAST
+                return self.direction is Direction.WEST or self.direction is Direction.EAST
             case ClosingType.DIRECTION_VERTICAL:
-                return self.direction == Direction.NORTH or self.direction == Direction.SOUTH
+                return self.direction is Direction.NORTH or self.direction is Direction.SOUTH
             case ClosingType.MIDDLE_PATHS:
                 return grid.is_middle(self.location)
             case ClosingType.MIDDLE_WEST:
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from .point import Point
 
 
-@dataclass
+@dataclass(slots=True)
 class WallPoints:
     """
     Points that are used to create the lines for a wall.
@@ -24,6 +24,16 @@ from erbsland_maze import (
     SvgFillMode,
 )
 
+# The command line values for the SVG unit and zero point.
+_SVG_UNIT_MAP: dict[str, SvgUnit] = {"mm": SvgUnit.MM, "px": SvgUnit.PX}
+_SVG_ZERO_POINT_MAP: dict[str, SvgZeroPoint] = {"center": SvgZeroPoint.CENTER, "top_left": SvgZeroPoint.TOP_LEFT}
+_SVG_UNIT_CHOICES: tuple[str, ...] = tuple(_SVG_UNIT_MAP)
+_SVG_ZERO_POINT_CHOICES: tuple[str, ...] = tuple(_SVG_ZERO_POINT_MAP)
+
+# The command line values for the parity and fill mode.
+_PARITY_CHOICES: list[str] = [str(x) for x in Parity]
+_FILL_MODE_CHOICES: list[str] = SvgFillMode.get_all_names()
+
 
 class UserError(Exception):
     pass
@@ -47,8 +57,7 @@ class CommandLineTool:
         """
         Parse the command line arguments.
         """
-        parser = argparse.ArgumentParser()
-        parser.formatter_class = argparse.RawDescriptionHelpFormatter
+        parser = argparse.ArgumentParser(formatter_class=argparse.RawDescriptionHelpFormatter)
         parser.description = """\
             This command generates a random maze and stores it in a SVG file.
         """
@@ -96,7 +105,10 @@ class CommandLineTool:
             "--no-marks", action="store_true", help="If specified, start and end positions are not marked."
         )
         parser.add_argument(
-            "--svg-unit", choices=["mm", "px"], default="mm", help="The unit used for for the generated SVG file."
+            "--svg-unit",
+            choices=_SVG_UNIT_CHOICES,
+            default="mm",
+            help="The unit used for for the generated SVG file.",
         )
         parser.add_argument(
             "--svg-dpi",
@@ -107,7 +119,7 @@ class CommandLineTool:
         )
         parser.add_argument(
             "--svg-zero-point",
-            choices=["center", "top_left"],
+            choices=_SVG_ZERO_POINT_CHOICES,
             default="center",
             help="Where the center point in the SVG file is placed.",
         )
@@ -117,16 +129,15 @@ class CommandLineTool:
             action="append",
             help="Specify two or more end points in the format '<placement>[/<offset>]'.",
         )
-        parity_choices = list(str(x) for x in Parity)
         parser.add_argument(
             "--width-parity",
-            choices=parity_choices,
+            choices=_PARITY_CHOICES,
             default="odd",
             help="The parity for the room count for the width of the maze.",
         )
         parser.add_argument(
             "--height-parity",
-            choices=parity_choices,
+            choices=_PARITY_CHOICES,
             default="odd",
             help="The parity for the room count for the height of the maze.",
         )
@@ -178,7 +189,7 @@ class CommandLineTool:
         parser.add_argument(
             "-i",
             "--fill-mode",
-            choices=SvgFillMode.get_all_names(),
+            choices=_FILL_MODE_CHOICES,
             default="stretch_edge",
             help="This option controls how the rooms are distributed in the specified canvas size.",
         )
@@ -212,14 +223,6 @@ class CommandLineTool:
             you chosen selection.
         """
         args = parser.parse_args()
-        if args.svg_unit == "px":
-            svg_unit = SvgUnit.PX
-        else:
-            svg_unit = SvgUnit.MM
-        if args.svg_zero_point == "top_left":
-            svg_zero_point = SvgZeroPoint.TOP_LEFT
-        else:
-            svg_zero_point = SvgZeroPoint.CENTER
         path_ends: Optional[list[PathEnd]] = None
         if args.end_point:
             path_ends = []
@@ -227,56 +230,45 @@ class CommandLineTool:
                 raise UserError("You must specify at least two end points.")
             if len(args.end_point) > 16:
                 raise UserError("You must specify not more than 16 end points.")
-            connected_end_points = 0
             for index, end_point in enumerate(args.end_point):
                 try:
-                    path_end = PathEnd.from_text(end_point)
-                    if not path_end.is_dead_end:
-                        connected_end_points += 1
-                    path_ends.append(path_end)
+                    path_ends.append(PathEnd.from_text(end_point))
                 except ValueError as error:
                     raise UserError(f"There was a problem with the {index+1}. end point you specified: {error}")
-            if connected_end_points < 2:
+            if sum(not path_end.is_dead_end for path_end in path_ends) < 2:
                 raise UserError("You must specify at least two connected end points that are no dead-ends.")
         svg_setup = SvgSetup(
-            width=float(args.width),
+            width=args.width,
             width_parity=Parity(args.width_parity),
-            height=float(args.height),
+            height=args.height,
             height_parity=Parity(args.height_parity),
-            wall_thickness=float(args.thickness),
-            side_length=float(args.length),
+            wall_thickness=args.thickness,
+            side_length=args.length,
             fill_mode=SvgFillMode.from_text(args.fill_mode),
             start_end_mark=(not args.no_marks),
-            svg_unit=svg_unit,
-            svg_dpi=float(args.svg_dpi),
-            svg_zero=svg_zero_point,
+            svg_unit=_SVG_UNIT_MAP[args.svg_unit],
+            svg_dpi=args.svg_dpi,
+            svg_zero=_SVG_ZERO_POINT_MAP[args.svg_zero_point],
         )
         svg_layout = SvgLayout(svg_setup)
-        self.output_path = Path(args.output)
+        self.output_path = args.output
         modifiers: list[Modifier] = []
-        if args.add_merge:
-            for index, parameter in enumerate(args.add_merge):
-                try:
-                    modifiers.append(MergeModifier.from_text(parameter))
-                except ValueError as error:
-                    raise UserError(f"There was a problem with your {index + 1}. merge modifier: {error}") from error
         if args.add_frame:
             try:
                 modifiers.append(FrameModifier.from_text(args.add_frame))
             except ValueError as error:
                 raise UserError(f"There was a problem with your frame modifier: {error}") from error
-        if args.add_blank:
-            for index, parameter in enumerate(args.add_blank):
-                try:
-                    modifiers.append(BlankModifier.from_text(parameter))
-                except ValueError as error:
-                    raise UserError(f"There was a problem with your {index + 1}. blank modifier: {error}") from error
-        if args.add_closing:
-            for index, parameter in enumerate(args.add_closing):
+        # The modifiers are grouped by their type later, so the order between the types does not matter.
+        for name, parameters, from_text in (
+            ("merge", args.add_merge, MergeModifier.from_text),
+            ("blank", args.add_blank, BlankModifier.from_text),
+            ("closing", args.add_closing, ClosingModifier.from_text),
+        ):
+            for index, parameter in enumerate(parameters or []):
                 try:
-                    modifiers.append(ClosingModifier.from_text(parameter))
+                    modifiers.append(from_text(parameter))
                 except ValueError as error:
-                    raise UserError(f"There was a problem with your {index + 1}. closing modifier: {error}") from error
+                    raise UserError(f"There was a problem with your {index + 1}. {name} modifier: {error}") from error
         setup = GeneratorSetup(
             path_ends=path_ends,
             modifiers=modifiers,
@@ -292,7 +284,7 @@ def main():
     try:
         working_set.run()
     except UserError as error:
-        exit(error)
+        raise SystemExit(str(error))
 
 
 if __name__ == "__main__":